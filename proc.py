@@ -1,11 +1,23 @@
 import os
 import re
+import sys
+import functools
+import io
 import json
 import pprint
 from datetime import date
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from collections import Counter
 import base64
 
+# optional, only speeds up loading data.json
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
 ################################################################################
 #
 # 	Overview: 
@@ -54,6 +66,15 @@ base_dir = os.getcwd()
 export_dir = Path(os.path.join(base_dir, "gml_code"))
 data_json_path = Path(os.path.join(base_dir, "gml_code", "data.json"))
 template_path = Path(os.path.join(base_dir, "ref_template.html"))
+spawn_script_files = ("scrProjEFSpawnDemon", "scrProjEFSpawnZombie")
+# scripts read by the get_*() functions, preloaded with the object code
+gml_script_files = (
+	"scrGlobalVars",
+	"scrLocalization",
+	*spawn_script_files,
+	"scrProjEFSystemBuff",
+	"scrProjEFMindControl",
+)
 
 debug_config = {
 	"include_context": [],
@@ -96,6 +117,49 @@ unavailable_obj_list = [
 	"oEFLabel", "oEFAddAbility", 
 ]
 
+# precompiled patterns, most of them run for every object
+_RE_CALL_PUNCT = re.compile(r'[(),]')
+_RE_RES = re.compile(r'oEF(\w+)Resistance')
+_RE_CHOOSE = re.compile(r'choose\(([^)]+)\)')
+_RE_SPAWN_CREW = re.compile(r'scrSpawnCrew\(\w+, \w+, (oCrew\w+)\)', re.MULTILINE)
+_RE_GAME_VERSION = re.compile(r'manualVersionNumber = "([^"]+)"')
+_RE_LABEL = re.compile(r'localization_functionText_add\("([^"]+)", "([^"]+)"\)')
+_RE_GLOBAL_VAR = re.compile(r'global\.(\w+) = (.+);')
+_RE_WEAPON_DESC_PARTS = re.compile(r'global\.(\w+)|generate_weapon_description\(\w+, \d+\)')
+_RE_WEAPON_DESC_EXT = re.compile(r'generate_weapon_description_ext\(\w+, \d+\, (.+)\)')
+_RE_SYS_ADD_EFFECT = re.compile(r'system_add_effect\(\w+, \w+, (\d+)\)')
+_RE_CREW_ADD_KEYWORD = re.compile(r'crew_add_keyword\(\w+, \w+, (\d+), \d+, \d+\)')
+# extra effect durations are read from one key line per function in these scripts
+_RE_EXTRA_EFFECT_DURATION = {
+	"scrProjEFSystemBuff": _RE_SYS_ADD_EFFECT,
+	"scrProjEFMindControl": _RE_CREW_ADD_KEYWORD,
+}
+# effect descriptions parsed manually from the gml code because the vars are 
+# local in nested scope
+_RE_EFFECT_DESC = {name: re.compile(var + r' = (".+")', re.MULTILINE) for name, var in {
+	"oEFDoorDamage": "str_doorBreakNegative",
+	"oEFRepairSpeed": "str_repairSpeedNegative",
+	"oEFSpeed": "str_moveSpeedNegative",
+	"oEFSystemDamage": "str_sysDmgNegative",
+
+	"oEFKillsExplode": "str",
+	"oEFLifeOnKill": "str",
+	"oEFPoisonAttack": "str",
+}.items()}
+# { text in item descriptions : replacement }
+item_desc_fixes = {
+	"Bloatmite": "Bloat Mite",
+	"an enchanted sword": "a Wraithblade",
+}
+_RE_ITEM_DESC_FIX = re.compile("|".join(map(re.escape, item_desc_fixes)))
+_RE_TEMPLATE_VAR = re.compile(r'##\w+##')
+_RE_OBJ_LINK = re.compile(r'{(\w+)#([^}]+)}')
+_RE_ANGLE_TAG = re.compile(r'<(\w+)>')
+
+# plain names can be checked with a set lookup, only the rest needs the regex
+_UNAVAIL_LITERAL = frozenset(p for p in unavailable_obj_list if not any(c in p for c in ".*+?[]()|"))
+_RE_UNAVAIL = re.compile("(?:" + "|".join(p for p in unavailable_obj_list if p not in _UNAVAIL_LITERAL) + ")$")
+
 cat_config = {
 	"Systems": { "fn": "proc_system" },
 	"Subsystems": { "fn": "proc_system" },
@@ -126,6 +190,7 @@ cat_config = {
 
 # storage:
 exp_data = {} # data.json
+gml_files = {} # { file name : contents of gml_code/<file name>.gml }
 parsed_code = {} # { object_name : simple kv represantion of vars/calls in object code }
 proc_data = {} # { object_name : processed data for display }
 
@@ -156,26 +221,24 @@ def proc_object_code():
 			entry["InternalName"] = obj_name[1:]
 			entry["ObjTags"] = ", ".join(exp_data["objTagsMap"][obj_name])
 			
-			for filter in unavailable_obj_list:
-				if re.match(filter + "$", obj_name):
-					entry["__unavailable"] = True
-					break
+			if obj_name in _UNAVAIL_LITERAL or _RE_UNAVAIL.match(obj_name):
+				entry["__unavailable"] = True
 
 			proc_data[name].append(entry)
 	
-		proc_data[name].sort(key=lambda e: e["Name"])
+		proc_data[name].sort(key=itemgetter("Name"))
 
 def proc_static():
 	l = [{
 		"Name": global_labels["label_factionShrine_blood"],
 		"InternalName": "ShrineNodeBlood",
-		"Faction": resolve_str("name", ["oKWFaction_blood"]),
+		"Faction": resolve_str("name", ("oKWFaction_blood",)),
 		"Extra Effects": "Commander loses 50% of current HP and cannot rest for 3 jumps, ship fight reward",
 		"Challenge": "Win ship fight"		
 	}, {
 		"Name": global_labels["label_factionShrine_death"],
 		"InternalName": "ShrineNodeDeath",
-		"Faction": resolve_str("name", ["oKWFaction_death"]),
+		"Faction": resolve_str("name", ("oKWFaction_death",)),
 		"Extra Effects": "Commander cannot rest for 3 jumps",
 		"Challenge": f"Win ship fight; Kill enemy boarders with broken sensors and 50% move speed debuff for 30s. 8x {obj_link("oCrewZombie_plain")}, " + 
 						f"Sector >=3: 10x random({obj_link("oCrewZombie_plain")}, {obj_link("oCrewZombie_pox")}), " + 
@@ -183,25 +246,25 @@ def proc_static():
 	}, {
 		"Name": global_labels["label_factionShrine_war"],
 		"InternalName": "ShrineNodeWar",
-		"Faction": resolve_str("name", ["oKWFaction_war"]),
+		"Faction": resolve_str("name", ("oKWFaction_war",)),
 		"Extra Effects": "Commander cannot rest for 3 jumps, 3 ship fight rewards",
 		"Challenge": "Win 3 ship fights"		
 	}, {
 		"Name": global_labels["label_factionShrine_empire"],
 		"InternalName": "ShrineNodeEmpire",
-		"Faction": resolve_str("name", ["oKWFaction_empire"]),
+		"Faction": resolve_str("name", ("oKWFaction_empire",)),
 		"Extra Effects": "Full crew heal, +10 Hull restored",
 		"Challenge": "None"		
 	}, {
 		"Name": global_labels["label_factionShrine_raider"],
 		"InternalName": "ShrineNodeRaider",
-		"Faction": resolve_str("name", ["oKWFaction_raider"]),
+		"Faction": resolve_str("name", ("oKWFaction_raider",)),
 		"Extra Effects": "Small reward (i.e. 50% low scrap; 5% ship weapon or module; or low tier item)",
 		"Challenge": "None"		
 	}, {
 		"Name": global_labels["label_factionShrine_techno"],
 		"InternalName": "ShrineNodeTechno",
-		"Faction": resolve_str("name", ["oKWFaction_techno"]),
+		"Faction": resolve_str("name", ("oKWFaction_techno",)),
 		"Extra Effects": "Small reward (i.e. 50% low scrap; 5% ship weapon or module; or low tier item)",
 		"Challenge": "Answer 3 questions like a machine would"		
 	}]
@@ -235,7 +298,7 @@ def proc_module(obj_list):
 	entry["Buy Price"] = resolve_num("buyPrice", obj_list)
 	entry["Description"] = resolve_str("description", obj_list)
 
-	if "buyableModule" not in exp_data["objTagsMap"][obj_list[0]]:
+	if "buyableModule" not in exp_data["objTagsSet"][obj_list[0]]:
 		entry["__unavailable"] = True
 
 	return entry
@@ -316,7 +379,7 @@ def proc_ship_weapon(obj_list):
 	entry["efc:Warp Breach"] = resolve_num("warpBreachChance", obj_list)
 	entry["Effects"] = proc_weapon_keywords(obj_list, not is_lance)
 
-	if "buyableWeapon" not in exp_data["objTagsMap"][obj_list[0]]:
+	if "buyableWeapon" not in exp_data["objTagsSet"][obj_list[0]]:
 		entry["__unavailable"] = True
 	
 	return entry
@@ -400,10 +463,10 @@ def proc_keyword(obj_list):
 		val = args[1]
 				
 		# val is object name
-		if re.match(r'^o\w+$', val) != None:
+		if val.startswith("o") and is_word(val[1:]):
 			val = obj_link(val, val[1:])
 		# non-numeric val
-		elif re.match(r'^-?\d+(?:\.\d+)?$', val) == None:
+		elif not is_number(val):
 			val = resolve_str(val, obj_list)
 
 		val = str(proc_resistance_value(args[0], val))
@@ -417,7 +480,7 @@ def proc_keyword(obj_list):
 	abilityName = resolve_raw("addsAbility", obj_list) or ""
 	abilityName = abilityName.replace("oAbl", "oItem")
 	if abilityName in parsed_code:
-		desc += obj_link(abilityName, resolve_str("name", [abilityName]))
+		desc += obj_link(abilityName, resolve_str("name", (abilityName,)))
 	
 	entry["Description"] = desc
 	return entry
@@ -456,7 +519,7 @@ def proc_system_upgrades(obj_list, entry):
 	if obj_list[0] == "oSysEngines":
 		entry["Tiers"] = upgrade_tiers[0] + " per level"
 	else:
-		entry["Tiers"] = list(dict.fromkeys(upgrade_tiers))
+		entry["Tiers"] = uniq(upgrade_tiers)
 
 def proc_effect_stacking(obj_list):
 	stacks = resolve_bool("enableStacking", obj_list)
@@ -520,11 +583,12 @@ def proc_crew_items(obj_list):
 			all_names.append(enemy_item_names[index])
 
 	is_player = exp_data["objParentMap"][obj_list[0]] == "oCrewPlayer"
-	all_names = list(dict.fromkeys(all_names))
-	for name in all_names:
+	enemy_names = set(enemy_item_names.values())
+	player_names = set(player_item_names.values())
+	for name in uniq(all_names):
 		prefix = ""
-		in_enemy = name in enemy_item_names.values()
-		in_player = name in player_item_names.values()
+		in_enemy = name in enemy_names
+		in_player = name in player_names
 		if is_player or in_enemy and in_player:
 			prefix = ""
 		elif in_player:
@@ -540,7 +604,7 @@ def proc_crew_faction(obj_list):
 	for args in args_for_calls(obj_list[0], "crew_init_keywords"):
 		for kw in args:
 			if kw.startswith("oKWFaction"):
-				return resolve_str("name", [kw])
+				return resolve_str("name", (kw,))
 	return ""
 
 def proc_crew_movespeed(obj_list):
@@ -553,19 +617,10 @@ def proc_crew_movespeed(obj_list):
 
 def proc_crew_keywords(obj_list):
 	kws = []
-	kw_calls = args_for_calls(obj_list[0], "crew_init_keywords")
-	args = kw_calls[0] if len(kw_calls) > 0 else []
-
-	if obj_list[1] != "oCrew":
-		parent_kw_calls = args_for_calls(obj_list[1], "crew_init_keywords")
-		if len(parent_kw_calls) > 0:
-			args.extend(parent_kw_calls[0])
-			args = list(dict.fromkeys(args))
-
-	for kw in args:
+	for kw in effective_crew_keywords(obj_list):
 		if kw.startswith("oKWFaction"):
 			continue
-		kw_desc = resolve_str("name", [kw])
+		kw_desc = resolve_str("name", (kw,))
 
 		if kw_desc == None or len(kw_desc) < 1:
 			kw_desc = obj_link(kw, kw[len("oKW"):])
@@ -576,29 +631,34 @@ def proc_crew_keywords(obj_list):
 	return "; ".join(kws)
 
 def proc_crew_resistances(obj_list, entry):
-	kws = []
-	kw_calls = args_for_calls(obj_list[0], "crew_init_keywords")
-	args = kw_calls[0] if len(kw_calls) > 0 else []
-
-	if obj_list[1] != "oCrew":
-		parent_kw_calls = args_for_calls(obj_list[1], "crew_init_keywords")
-		if len(parent_kw_calls) > 0:
-			args.extend(parent_kw_calls[0])
-			args = list(dict.fromkeys(args))
-	
 	entry[f"res:Fire Resistance"] = 0
 	entry[f"res:Poison Resistance"] = 0
 	entry[f"res:Vacuum Resistance"] = 0
-	for kw in args:
+	for kw in effective_crew_keywords(obj_list):
 		res_effect = None
 		for args in args_for_calls(kw, "effect_add"):
-			res_match = re.match(r'oEF(\w+)Resistance', args[0])
+			res_match = _RE_RES.match(args[0])
 			if res_match:
 				res_val = args[1]
-				if re.match(r'-?\d+', res_val) == None:
-					res_val = resolve_num(res_val, [kw])
+				# not starting with a number
+				if not res_val.removeprefix("-")[:1].isdecimal():
+					res_val = resolve_num(res_val, (kw,))
 				entry[f"res:{res_match.group(1)} Resistance"] = proc_resistance_value(args[0], res_val)
 
+@functools.lru_cache(maxsize = None)
+def effective_crew_keywords(obj_list):
+	# own keywords plus the ones of the parent unless that's the oCrew base.
+	# copies the args, extending them in place would modify parsed_code
+	kw_calls = args_for_calls(obj_list[0], "crew_init_keywords")
+	args = list(kw_calls[0]) if len(kw_calls) > 0 else []
+
+	if obj_list[1] != "oCrew":
+		parent_kw_calls = args_for_calls(obj_list[1], "crew_init_keywords")
+		if len(parent_kw_calls) > 0:
+			args.extend(parent_kw_calls[0])
+			args = uniq(args)
+	return tuple(args)
+
 def proc_weapon_keywords(obj_list, include_ign_shields):
 	descs = []
 
@@ -635,43 +695,43 @@ def proc_item_summon(obj_list, entry):
 	else:
 		ability = resolve_raw("addsAbility", obj_list)
 		if ability and (ability.startswith("oAblSummon") or ability.startswith("oAblConsumableSummon")):
-			spawn_script = resolve_raw("applyShipEffectScript", [ability])
+			spawn_script = resolve_raw("applyShipEffectScript", (ability,))
 			if spawn_script:
 				spawn_obj = spawn_crew_for_script[spawn_script]
 			else:
 				gml_str = read_gml(ability)
-				crew_match = re.search(r'scrSpawnCrew\(\w+, \w+, (oCrew\w+)\)', gml_str, flags = re.MULTILINE)
+				crew_match = _RE_SPAWN_CREW.search(gml_str)
 				if crew_match:
 					spawn_obj = crew_match.group(1)
 		
 	if spawn_obj:
 		if spawn_obj not in parsed_code:
 			return
-		spawn_name = resolve_str("name", [spawn_obj])
+		spawn_name = resolve_str("name", (spawn_obj,))
 		link = obj_link(spawn_obj, spawn_name)
-		entry["Description"] = re.sub(spawn_name, link, desc, flags = re.IGNORECASE)
+		entry["Description"] = name_pattern(spawn_name).sub(link, desc)
 
 def proc_extra_item_ability_attributes(obj_list, entry):
 	ability = resolve_raw("addsAbility", obj_list)
 	if ability and ability.startswith("oAbl"):
-		ct = resolve_num("chargeTime", [ability])
+		ct = resolve_num("chargeTime", (ability,))
 		if ct:
 			entry["Charge Time"] = ct
-		cd = resolve_num("cooldown", [ability])
+		cd = resolve_num("cooldown", (ability,))
 		if cd:
 			entry["Cooldown"] = cd	
-		pj = proc_projectile_speed([ability])
+		pj = proc_projectile_speed((ability,))
 		if pj:
 			entry["Projectile Speed"] = pj
 
 		# lots of ways duration is specified
-		dr = resolve_num("applyKWLifespan", [ability])
+		dr = resolve_num("applyKWLifespan", (ability,))
 		if not dr:
-			dr = resolve_num("appliedKeywordDuration", [ability])
+			dr = resolve_num("appliedKeywordDuration", (ability,))
 		if not dr:
-			dr = resolve_num("duration", [ability])
+			dr = resolve_num("duration", (ability,))
 		if not dr:
-			effect_scr = resolve_str("applyShipEffectScript", [ability])
+			effect_scr = resolve_str("applyShipEffectScript", (ability,))
 			if effect_scr:
 				dr = extra_effect_durations.get(effect_scr)
 		if dr:
@@ -679,31 +739,20 @@ def proc_extra_item_ability_attributes(obj_list, entry):
 
 def proc_random_item(obj_list, name):
 	item_obj_names = []
-	choose_match = re.match(r'choose\(([^)]+)\)', name)
+	choose_match = _RE_CHOOSE.match(name)
 	
 	if choose_match:
 		item_obj_names = choose_match.group(1).split(", ")
 	else: 
 		item_obj_names = [name]
 	
+	# count by object first so each distinct item is resolved and linked once
 	item_names = []
-	item_count = {}
-	for obj_name in item_obj_names:
-		item_name = resolve_str("name", [obj_name])
-		
+	for obj_name, count in Counter(item_obj_names).items():
+		item_name = resolve_str("name", (obj_name,))
 		if item_name:
-			item_name = obj_link(obj_name, item_name)
-			item_names.append(item_name)
-			if item_name in item_count:
-				item_count[item_name] = item_count[item_name] + 1
-			else:
-				item_count[item_name] = 1
-	
-	item_names = []
-	for item_name in item_count:
-		if item_count[item_name] > 1:
-			item_name = f"{item_name}[{item_count[item_name]}]"
-		item_names.append(item_name)
+			link = obj_link(obj_name, item_name)
+			item_names.append(f"{link}[{count}]" if count > 1 else link)
 	display_name = ", ".join(item_names)
 	if choose_match and len(item_names) > 1:
 		display_name = f"random({display_name})"
@@ -719,36 +768,41 @@ def proc_resistance_value(effect_name, value_str):
 ## MARK: Parsing & Patching
 ################################################################################
 
-def resolve_num(var_name, obj_names, index = -1):
+@functools.lru_cache(maxsize = None)
+def flat_code_for(obj_names):
+	# parsed_code of a whole hierarchy merged into a single table, children
+	# override their parents. Values keep the part of the hierarchy they were
+	# found in so referenced vars are resolved from the same starting point.
 	if len(obj_names) == 0:
-		return None
-	
+		return {}
+
+	flat = dict(flat_code_for(obj_names[1:]))
+	for var_name, var_val in parsed_code[obj_names[0]].items():
+		if var_val and not var_name.startswith("__"):
+			flat[var_name] = (var_val, obj_names)
+	return flat
+
+@functools.lru_cache(maxsize = None)
+def resolve_num(var_name, obj_names, index = -1):
 	ret_val = None
 	if index > -1:
 		var_name = var_name.split(":")[0] + ":" + str(index)	
-	var_val = parsed_code[obj_names[0]].get(var_name, None)
+	var_val, owner_names = flat_code_for(obj_names).get(var_name, (None, None))
 	
 	if var_val:
-		var_val = var_val.replace("room_speed", "").replace("*", "").replace("/", "").strip()
-		if re.match(r'^-?\d+\.\d+$', var_val):
-			ret_val = float(var_val)
-		elif re.match(r'^-?\d+$', var_val):
-			ret_val = int(var_val)
-		else:
-			ret_val = resolve_num(var_val, obj_names)
-	else:
-		ret_val = resolve_num(var_name, obj_names[1:], index)
+		num_expr = clean_num_expr(var_val)
+		ret_val = num_literal(num_expr)
+		if ret_val == None:
+			ret_val = resolve_num(num_expr, owner_names)
 	
 	return ret_val
 
+@functools.lru_cache(maxsize = None)
 def resolve_bool(var_name, obj_names, index = -1):
-	if len(obj_names) == 0:
-		return None
-	
 	ret_val = None
 	if index > -1:
 		var_name = var_name.split(":")[0] + ":" + str(index)
-	var_val = parsed_code[obj_names[0]].get(var_name, None)
+	var_val, owner_names = flat_code_for(obj_names).get(var_name, (None, None))
 	if index > -1 and isinstance(var_val, list):
 		var_val = var_val[index]	
 	
@@ -758,20 +812,16 @@ def resolve_bool(var_name, obj_names, index = -1):
 		elif var_val == "false" or var_val == "1":
 			ret_val = False
 		else:
-			ret_val = resolve_bool(var_val, obj_names)
-	else:
-		ret_val = resolve_bool(var_name, obj_names[1:], index)
+			ret_val = resolve_bool(var_val, owner_names)
 	
 	return ret_val
 
+@functools.lru_cache(maxsize = None)
 def resolve_str(var_name, obj_names, index = -1):
-	if len(obj_names) == 0:
-		return None
-	
 	ret_val = None
 	if index > -1:
 		var_name = var_name.split(":")[0] + ":" + str(index)
-	var_val = parsed_code[obj_names[0]].get(var_name, None)
+	var_val, owner_names = flat_code_for(obj_names).get(var_name, (None, None))
 
 	if var_val:
 		parts = var_val.split(" + ")
@@ -780,35 +830,37 @@ def resolve_str(var_name, obj_names, index = -1):
 		for p in parts:
 			add_val = None
 			
+			first = p[0]
+			
 			# is string literal?
-			if p[0] == '"' and p[-1] == '"':
+			if first == '"' and p[-1] == '"':
 				add_val = p[1:-1]
-			# or number?
-			elif re.match(r'^-?\d+(\.\d+)$', p):
+			# or number? vars and calls can't start with these
+			elif first == "-" or first.isdigit():
 				add_val = p
 			# function call?
 			else:
-				var_name = p
-				str_fn_match = re.match(r'^string\((.+)\)$', p)
-				if str_fn_match:
-					val = str_fn_match.group(1)
-					str_format_match = re.match(r'^"([^"]+)", (\w+)$', val)
+				fn_name, _, fn_args_str = p.partition("(")
+				is_fn_call = p.endswith(")") and len(fn_args_str) > 1 and is_word(fn_name)
+				if is_fn_call and fn_name == "string":
+					val = fn_args_str[:-1]
+					fmt_end = val.find('"', 1)
+					str_arg = val[fmt_end + 3:]
 					# string("format {0}", arg) supports more than 1 arg, we don't
-					if str_format_match:
-						str_arg = str_format_match.group(2)
-						arg_val = resolve_num(str_arg, obj_names)
+					if val[0] == '"' and fmt_end > 1 and val.startswith('", ', fmt_end) and is_word(str_arg):
+						arg_val = resolve_num(str_arg, owner_names)
 						if arg_val == None:
-							arg_val = resolve_str(str_arg, obj_names)
-						add_val = str_format_match.group(1).replace("{0}", str(arg_val))
+							arg_val = resolve_str(str_arg, owner_names)
+						add_val = val[1:fmt_end].replace("{0}", str(arg_val))
 					else:
-						int_val = resolve_num(val, obj_names)
+						int_val = resolve_num(val, owner_names)
 						if int_val:
 							add_val = str(int_val)
 				# unknown fn call in value. preserve value as is
-				elif re.match(r'^\w+\((.+)\)$', p):
+				elif is_fn_call:
 					add_val = p
 				else:
-					add_val = resolve_str(var_name, obj_names)
+					add_val = resolve_str(p, owner_names)
 					
 			if add_val is None:
 				# return symbol name if it cannot be resolved
@@ -817,19 +869,29 @@ def resolve_str(var_name, obj_names, index = -1):
 				add_val = add_val.removesuffix("\\n").replace("\\\"", "\"").replace("\\n\\n", "; ").replace("\\n", "; ")
 			ret.append(add_val)
 		ret_val = "".join(ret)
-	else:
-		ret_val = resolve_str(var_name, obj_names[1:], index)
 	
 	return ret_val
 
+@functools.lru_cache(maxsize = None)
 def resolve_raw(var_name, obj_names, index = -1):
-	for obj_name in obj_names:
-		if index > -1:
-			var_name = var_name.split(":")[0] + ":" + str(index)
-		var_val = parsed_code[obj_name].get(var_name, None)
-		if var_val:
-			return var_val
-	return None
+	if index > -1:
+		var_name = var_name.split(":")[0] + ":" + str(index)
+	var_val, _ = flat_code_for(obj_names).get(var_name, (None, None))
+	return var_val
+
+def clear_resolve_caches():
+	# resolve_ results are memoized, parsed_code must not change afterwards
+	for fn in (flat_code_for, resolve_num, resolve_bool, resolve_str, resolve_raw, effective_crew_keywords):
+		fn.cache_clear()
+
+def intern_object_names():
+	# object names are compared and hashed all over the place, interning them
+	# once lets most of those checks succeed on identity alone
+	intern = sys.intern
+	for cat in exp_data["objCatData"]:
+		cat["objNames"] = [intern(n) for n in cat["objNames"]]
+	exp_data["objParentMap"] = {intern(k): intern(v) if isinstance(v, str) else v for k, v in exp_data["objParentMap"].items()}
+	exp_data["objTagsMap"] = {intern(k): v for k, v in exp_data["objTagsMap"].items()}
 
 def parse_object_code():
 	for obj_name in exp_data["objParentMap"]:
@@ -844,6 +906,8 @@ def parse_gml(gml):
 	# only if they aren't the value of an assignment. Indented code is ignored.
 	tbl = {}
 	calls = []
+	# call and var names are interned like the object names
+	intern = sys.intern
 	
 	for line in gml.splitlines():
 		if line == "return":
@@ -857,117 +921,116 @@ def parse_gml(gml):
 			continue
 		
 		# function call
-		fn_match = re.search(r'^([\w_]+)\((.+)\)$', line)
-		if fn_match != None:
-			fn_name = fn_match.group(1)
-			fn_args_str = fn_match.group(2)
-			
-			# preserve nested call args as string, e.g. foo(1, bar(2, 3))
-			# this much simpler one liner would mess that up:
-			# fn_args = list(map(str.strip, fn_match.group(2).split(",")))
-			fn_args = []
-			cur_i = 0
-			nested_fn = False
-			for i in range(len(fn_args_str)):
-				if not nested_fn and fn_args_str[i] == "(":
-					nested_fn = True
-				if nested_fn and fn_args_str[i] == ")":
-					nested_fn = False
-				if not nested_fn and fn_args_str[i] == ",":
-					fn_args.append(fn_args_str[cur_i:i].strip())
-					cur_i = i + 1
-				elif i == len(fn_args_str) - 1:
-					fn_args.append(fn_args_str[cur_i:].strip())
-
-			call = {"fn": fn_name, "args": fn_args}
+		fn_name, _, fn_args_str = line.partition("(")
+		if line.endswith(")") and len(fn_args_str) > 1 and fn_name.isidentifier():
+			call = {"fn": intern(fn_name), "args": split_call_args(fn_args_str[:-1])}
 			calls.append(call)
 			continue
 		
 		# assignment
 		kv_pair = kv = line.split(" = ", maxsplit = 1)
 		if len(kv_pair) == 2:
-			var = kv_pair[0]
+			var = intern(kv_pair[0])
 			val = kv_pair[1]
 			
 			# simple assignment or indexed
-			idx_match = re.search(r'^([\w_]+)\[(\d+)\]$', var)
-			if idx_match == None:
-				tbl[var] = val
-			else:
-				var = idx_match.group(1)
-				idx = int(idx_match.group(2))
+			arr_var, _, idx_str = var.rpartition("[")
+			if var.endswith("]") and arr_var.isidentifier() and idx_str[:-1].isdecimal():
+				idx = int(idx_str[:-1])
 				
-				tbl[var + ":" + str(idx)] = val
+				tbl[intern(arr_var + ":" + str(idx))] = val
+			else:
+				tbl[var] = val
 
 	tbl["__calls"] = calls
 	
 	return tbl
 
+def split_call_args(args_str):
+	# preserve nested call args as string, e.g. foo(1, bar(2, 3))
+	# this much simpler one liner would mess that up:
+	# args = list(map(str.strip, args_str.split(",")))
+	args = []
+	arg_start = 0
+	depth = 0
+	# visit only the parens and commas, tracking the nesting depth
+	for m in _RE_CALL_PUNCT.finditer(args_str):
+		c = m.group()
+		if c == "(":
+			depth += 1
+		elif c == ")":
+			depth = max(depth - 1, 0)
+		elif depth == 0:
+			args.append(args_str[arg_start:m.start()].strip())
+			arg_start = m.end()
+
+	# a trailing comma doesn't start another arg
+	if arg_start < len(args_str):
+		args.append(args_str[arg_start:].strip())
+	return args
+
+def index_object_calls():
+	# group call args by function name for args_for_calls(), has to run after
+	# patching since that may add calls
+	for tbl in parsed_code.values():
+		calls_by_fn = {}
+		for call in tbl.get("__calls", ()):
+			calls_by_fn.setdefault(call["fn"], []).append(call["args"])
+		tbl["__calls_by_fn"] = calls_by_fn
+
+def clean_num_expr(var_val):
+	# drop room_speed conversions, e.g. "5 * room_speed" is 5 seconds
+	return var_val.replace("room_speed", "").replace("*", "").replace("/", "").strip()
+
+def num_literal(num_expr):
+	if is_float(num_expr):
+		return float(num_expr)
+	elif is_int(num_expr):
+		return int(num_expr)
+	return None
+
 def get_game_version():
 	globals_gml = read_gml("scrGlobalVars")
-	version_match = re.search(r'manualVersionNumber = "([^"]+)"', globals_gml)
+	version_match = _RE_GAME_VERSION.search(globals_gml)
 	if version_match:
 		return version_match.group(1)
 	return "UNKNOWN VERSION"
 
 def get_global_labels():
-	labels = {}
 	labels_gml = read_gml("scrLocalization")
-	matches = re.findall(r'localization_functionText_add\("([^"]+)", "([^"]+)"\)', labels_gml)
-	for match in matches:
-		labels[match[0]] = match[1]
-	return labels
+	return {m.group(1): m.group(2) for m in _RE_LABEL.finditer(labels_gml)}
 
 def get_global_vars():
-	vars = {}
 	vars_gml = read_gml("scrGlobalVars")
-	matches = re.findall(r'global\.(\w+) = (.+);', vars_gml)
-	for match in matches:
-		vars[match[0]] = match[1]
-	return vars
+	return {m.group(1): m.group(2) for m in _RE_GLOBAL_VAR.finditer(vars_gml)}
 
 def get_extra_effect_durations():
 	tbl = {}
-	files = {
-		"scrProjEFSystemBuff": r'system_add_effect\(\w+, \w+, (\d+)\)',
-		"scrProjEFMindControl": r'crew_add_keyword\(\w+, \w+, (\d+), \d+, \d+\)',
-	}
-	for file, regex in files.items():
+	for file, regex in _RE_EXTRA_EFFECT_DURATION.items():
 		matches = matches_in_functions(file, regex)
-		matches = {fn: int(match.group(1)) for fn, match in matches.items()}
+		matches = {fn: int(groups[0]) for fn, groups in matches.items()}
 		tbl.update(matches)
 	return tbl
 
 def get_spawn_scripts():
 	tbl = {}
-	files = ["scrProjEFSpawnDemon", "scrProjEFSpawnZombie"]
-	crew_name_regex = r'scrSpawnCrew\(\w+, \w+, (oCrew\w+)\)'
-	for file in files:
-		matches = matches_in_functions(file, crew_name_regex)
-		matches = {fn: match.group(1) for fn, match in matches.items()}
+	for file in spawn_script_files:
+		matches = matches_in_functions(file, _RE_SPAWN_CREW)
+		matches = {fn: groups[0] for fn, groups in matches.items()}
 		tbl.update(matches)
 	return tbl
 
 def patch_object_code():
 	for obj_name in parsed_code:
-		obj_list = hierarchy_for_object(obj_name)
-		if obj_list[-1] == "oWeapon":
-			patch_ship_weapon(parsed_code[obj_name], obj_name)
-		elif obj_list[-1] == "oKeyword":
-			patch_keyword(parsed_code[obj_name], obj_name)
-		elif obj_list[-1] == "oEffect":
-			patch_effect(parsed_code[obj_name], obj_name)
-		elif obj_list[-1] == "oCrew":
-			patch_crew(parsed_code[obj_name], obj_name)
-		elif obj_list[-1] == "oItem":
-			patch_item(parsed_code[obj_name], obj_name)
+		patch_fn = patch_fn_for_root_obj.get(root_obj_for_object(obj_name))
+		if patch_fn:
+			patch_fn(parsed_code[obj_name], obj_name)
 
 def patch_item(tbl, name):
 	# fix inconsistent spelling/naming to make crew links work
 	desc = tbl.get("description")
 	if desc:
-		desc = desc.replace("Bloatmite", "Bloat Mite")
-		desc = desc.replace("an enchanted sword", "a Wraithblade")
+		desc = _RE_ITEM_DESC_FIX.sub(lambda m: item_desc_fixes[m.group(0)], desc)
 		tbl["description"] = desc
 
 def patch_crew(tbl, name):
@@ -977,18 +1040,24 @@ def patch_crew(tbl, name):
 def patch_ship_weapon(tbl, name):
 	desc = tbl.get("description")
 	if desc:
-		desc = re.sub(r'global\.(\w+)', lambda m: f'"{global_labels[m.group(1)]}"', desc)
-		desc = re.sub(r'generate_weapon_description\(\w+, \d+\)', "", desc)
-		desc = re.sub(r'generate_weapon_description_ext\(\w+, \d+\, (.+)\)', lambda m: m.group(1), desc)
+		# global labels and the generated description in one pass, the _ext 
+		# variant's greedy args only after all other calls are gone
+		desc = _RE_WEAPON_DESC_PARTS.sub(weapon_desc_part, desc)
+		desc = _RE_WEAPON_DESC_EXT.sub(lambda m: m.group(1), desc)
 		desc = desc.removeprefix(" + ")
 		tbl["description"] = desc
 	
 	if name == "oWPLanceBreach": 
 		tbl["applyKWLifespan"] = global_vars["defaultAttackKeywordLifespan"]
 
+def weapon_desc_part(m):
+	if m.group(1):
+		return f'"{global_labels[m.group(1)]}"'
+	return ""
+
 def patch_keyword(tbl, name):
 	if name.startswith("oKWFaction_"):
-		tbl["description"] = "\"" + resolve_str("name", [name]) + " Faction\""
+		tbl["description"] = "\"" + resolve_str("name", (name,)) + " Faction\""
 	elif name == "oKWMindControlled":
 		tbl["__calls"].append({ "fn": "effect_add", "args": ["oEFMindControlled", "0"] })
 	elif "description" not in tbl and "str_label" in tbl:
@@ -1012,39 +1081,52 @@ def patch_effect(tbl, name):
 		"oEFUnstable": "Expires after a given time",
 	}
 
-	# manually parse value from gml str because the vars are local in nested scope
-	parse_from_gml_str_var = {
-		"oEFDoorDamage": "str_doorBreakNegative",
-		"oEFRepairSpeed": "str_repairSpeedNegative",
-		"oEFSpeed": "str_moveSpeedNegative",
-		"oEFSystemDamage": "str_sysDmgNegative",
-
-		"oEFKillsExplode": "str",
-		"oEFLifeOnKill": "str",
-		"oEFPoisonAttack": "str",
-	}
-
 	if name in static_desc_overrides:
 		tbl["description"] = '"' + static_desc_overrides[name] + '"'
-	elif name in parse_from_gml_str_var:
-		gml_str = read_gml(name)
-		regex = parse_from_gml_str_var[name] + r' = (".+")'
-		match = re.search(regex, gml_str, flags = re.MULTILINE)
+	elif name in _RE_EFFECT_DESC:
+		match = _RE_EFFECT_DESC[name].search(read_gml(name))
 		if match:
 			tbl["description"] = match.group(1)
 	elif name.endswith("Resistance"):
 		tbl["description"] = '"' + name[len("oEF"):-len("Resistance")] + ' resistance [value]%"'
 
+# { root object of the hierarchy : patch function }
+patch_fn_for_root_obj = {
+	"oWeapon": patch_ship_weapon,
+	"oKeyword": patch_keyword,
+	"oEffect": patch_effect,
+	"oCrew": patch_crew,
+	"oItem": patch_item,
+}
+
 ################################################################################
 ## MARK: General Utils
 ################################################################################
 	
+def read_all_gml():
+	# reads the code of every object and the gml_script_files in one batch,
+	# the reads overlap in a thread pool. The export has many more files 
+	# (events, other scripts) that are never used. Objects without a code 
+	# file are stored as None.
+	files = uniq([*exp_data["objParentMap"], *gml_script_files])
+	existing_files = set(os.listdir(export_dir))
+	with ThreadPoolExecutor() as pool:
+		contents = pool.map(lambda file: read_gml_file(file) if file + ".gml" in existing_files else None, files)
+		return dict(zip(files, contents))
+
+def read_gml_file(file):
+	try:
+		return (export_dir / (file + ".gml")).read_text(encoding = "utf-8")
+	except FileNotFoundError:
+		return None
+
 def read_gml(file):
-	path = Path(os.path.join(export_dir, file + ".gml"))
-	if os.path.exists(path):
-		return path.read_text()
-	return None
+	# files that weren't preloaded are read from disk on first use
+	if file not in gml_files:
+		gml_files[file] = read_gml_file(file)
+	return gml_files[file]
 
+@functools.lru_cache(maxsize = None)
 def hierarchy_for_object(obj_name):
 	obj_list = [obj_name]
 	while True:
@@ -1053,41 +1135,74 @@ def hierarchy_for_object(obj_name):
 			obj_list.append(obj_name)
 		else:
 			break
-	return obj_list
+	return tuple(obj_list)
+
+@functools.lru_cache(maxsize = None)
+def root_obj_for_object(obj_name):
+	# last element of hierarchy_for_object() without building the hierarchy
+	parent_name = exp_data["objParentMap"][obj_name]
+	if parent_name and parent_name != "__NONE__" and parent_name != "oSaveObject":
+		return root_obj_for_object(parent_name)
+	return obj_name
 
 def args_for_calls(obj_name, call_name):
-	ret_val = []
-	for call in parsed_code[obj_name]["__calls"]:
-		if call["fn"] == call_name:
-			ret_val.append(call["args"])
-	return ret_val
+	return parsed_code[obj_name]["__calls_by_fn"].get(call_name, ())
 
 def matches_in_functions(file, regex, fn_names = None):
 	# a common pattern in the game code is a list of functions
-	# with one key line per function we want to extract
+	# with one key line per function we want to extract, regex is compiled.
+	# Returns the groups of the first line matching regex after each function.
 	ret = {}
 
-	script_gml = read_gml(file)
-	cur_fn_name = None
-	fn_name_regex = r'^function (\w+)'
-
-	for line in script_gml.splitlines():
-		if cur_fn_name == None:
-			fn_name_match = re.search(fn_name_regex, line)
-			if fn_name_match and (fn_names == None or fn_name_match.group(1) in fn_names):
-				cur_fn_name = fn_name_match.group(1)
-		else:
-			match = re.search(regex, line)
-			if match:
-				ret[cur_fn_name] = match
-				cur_fn_name = None
+	fn_regex = fn_match_pattern(regex, None if fn_names == None else tuple(fn_names))
+	for match in fn_regex.finditer(read_gml(file)):
+		ret[match.group(1)] = match.groups()[1:]
 
 	return ret
 
+@functools.lru_cache(maxsize = None)
+def fn_match_pattern(regex, fn_names):
+	fn_name_regex = r'(\w+)'
+	if fn_names != None:
+		fn_name_regex = "(" + "|".join(map(re.escape, fn_names)) + r')\b'
+	# skip whole lines after the function header until one matches the regex
+	return re.compile(r'^function ' + fn_name_regex + r'.*\n(?:.*\n)*?.*?' + regex.pattern, re.MULTILINE)
+
 def base64_file(filename):
+	# encode in chunks of a multiple of 3 bytes so no padding ends up in the 
+	# middle of the output
+	chunks = []
 	with open(filename, "rb") as file:
-		return base64.b64encode(file.read()).decode()
-	return None
+		while chunk := file.read(57 * 1024):
+			chunks.append(base64.b64encode(chunk))
+	return b"".join(chunks).decode("ascii")
+
+@functools.lru_cache(maxsize = None)
+def name_pattern(name):
+	# matches the name as plain text, names may contain regex special chars
+	return re.compile(re.escape(name), re.IGNORECASE)
+
+def uniq(seq):
+	# order preserving dedup
+	seen = set()
+	seen_add = seen.add
+	return [x for x in seq if not (x in seen or seen_add(x))]
+
+def is_word(s):
+	# same as matching r'^\w+$'
+	return s.replace("_", "a").isalnum()
+
+def is_int(s):
+	# same as matching r'^-?\d+$'
+	return s.removeprefix("-").isdecimal()
+
+def is_float(s):
+	# same as matching r'^-?\d+\.\d+$'
+	int_part, dot, frac_part = s.partition(".")
+	return dot != "" and is_int(int_part) and frac_part.isdecimal()
+
+def is_number(s):
+	return is_int(s) or is_float(s)
 
 def obj_link(obj_name, text = None):
 	if text == None:
@@ -1099,9 +1214,6 @@ def obj_link(obj_name, text = None):
 ## MARK: Render Output
 ################################################################################
 
-def render_obj_link(val):
-	return re.sub(r'{(\w+)#([^}]+)}', r'<a href="#\1" class="obj_link">\2</a>', str(val))
-
 def render_table(data, config, name, is_static):
 	# col_name: is_numeric
 	col_data = { "Name": False, "InternalName": False, "ObjTags": False }
@@ -1115,13 +1227,14 @@ def render_table(data, config, name, is_static):
 			val = row.get(col_name, None)
 			
 			col_is_numeric = col_data.get(col_name, True)
-			val_is_numeric = val == None or isinstance(val, int) or isinstance(val, float)
+			val_is_numeric = val is None or isinstance(val, (int, float))
 
 			if isinstance(val, float):
-				if col_name not in col_float_width:
-					col_float_width[col_name] = len(str(val).split(".")[1])
-				else:
-					col_float_width[col_name] = max(len(str(val).split(".")[1]), col_float_width[col_name])
+				# number of decimal places
+				val_str = repr(val)
+				dot_idx = val_str.rfind(".")
+				width = len(val_str) - dot_idx - 1 if dot_idx >= 0 else 0
+				col_float_width[col_name] = max(width, col_float_width.get(col_name, 0))
 
 			col_data[col_name] = col_is_numeric and val_is_numeric
 	
@@ -1138,30 +1251,37 @@ def render_table(data, config, name, is_static):
 		for label in config["col_span"]:
 			prefix = config["col_span"][label]
 			span_label_for_prefix[prefix] = label
-			span_num_for_prefix[prefix] = 0
 
-			first_idx = -1
-			insert_idx = -1
+		cols_for_prefix = {}
+		for col_name in col_order:
+			prefix = col_name.partition(":")[0]
+			if prefix in span_label_for_prefix:
+				cols_for_prefix.setdefault(prefix, []).append(col_name)
 
-			for i in range(len(col_order)):
-				col_name = col_order[i]
-				prefix_name_pair = col_name.split(":")
-				if prefix_name_pair[0] == prefix:
-					has_groups = True
-					span_num_for_prefix[prefix] = span_num_for_prefix[prefix] + 1
+		# rebuild the order in one pass, all columns of a group move to the 
+		# position of its first column
+		grouped_col_order = []
+		for col_name in col_order:
+			group = cols_for_prefix.get(col_name.partition(":")[0])
+			if group is None:
+				grouped_col_order.append(col_name)
+			elif group[0] == col_name:
+				grouped_col_order.extend(group)
+		col_order = grouped_col_order
 
-					if first_idx < 0:
-						first_idx = i
-						insert_idx = i + 1
-					else:
-						del col_order[i]
-						col_order.insert(insert_idx, col_name)
-						insert_idx = insert_idx + 1
+		for prefix in span_label_for_prefix:
+			span_num_for_prefix[prefix] = len(cols_for_prefix.get(prefix, ()))
+		has_groups = len(cols_for_prefix) > 0
 
 	th_span_cells = []
 	handled_spans = []
 	th_cells = []
 
+	bool_glyphs = {
+		"True": "&#x2713;",
+		"False": "&#x2A09;",
+	}
+
 	cell_classes = {
 		"InternalName": "col_internal_name",
 		"ObjTags": "col_obj_tags",
@@ -1191,65 +1311,76 @@ def render_table(data, config, name, is_static):
 
 		th_cells.append(f'<th title="{col_name}" class="{th_class}">{col_title_abbreviations.get(col_name, col_name)}</th>')
 
-	thead_content = ""
+	# per column data that's the same for every row:
+	# (col_name, is_name, is_numeric, class attr, float format)
+	col_meta = []
+	for col_name in col_order:
+		is_numeric = col_data[col_name]
+		td_class = cell_classes.get(col_name, "")
+		float_fmt = None
+		if is_numeric:
+			td_class += " numeric_val"
+			if col_name in col_float_width:
+				float_fmt = f"%.{col_float_width[col_name]}f"
+		col_meta.append((col_name, col_name == "Name", is_numeric, f' class="{td_class}"', float_fmt))
+
+	# header, rows and cells are written into one buffer
+	buf = io.StringIO()
+	w = buf.write
+	w(f'\n\n<table id="data_{name}" class="sortable {"grouped_header" if has_groups else ""}">\n<thead>')
 	if len(th_span_cells) > 0:
-		thead_content += f'\n<tr class="span_groups">{"\n\t" + "\n\t".join(th_span_cells)}</tr>'
-	thead_content += f'\n<tr>{"\n\t" + "\n\t".join(th_cells)}</tr>'
-	
+		w(f'\n<tr class="span_groups">{"\n\t" + "\n\t".join(th_span_cells)}</tr>')
+	w(f'\n<tr>{"\n\t" + "\n\t".join(th_cells)}</tr>')
+	w('</thead>\n<tbody>')
+
 	# render data cells, apply numeric class
-	rows = []
+	row_sep = ""
 	for entry in data:
-		td_cells = []
-		for col_name in col_order:
+		tr_class = ""
+		if entry.get("__unavailable"):
+			tr_class = "unavailable"
+		w(f'{row_sep}<tr id="{entry["InternalName"]}" class="{tr_class}">')
+		row_sep = "\n"
+
+		for col_name, is_name, is_numeric, class_attr, float_fmt in col_meta:
 			attr_str = ""
 			val = entry.get(col_name)
-			td_class = cell_classes.get(col_name, "")
 
-			if col_name == "Name":
+			if is_name:
 				attr_str = f' title="{entry["InternalName"]}"'
 				val = f'<a href="#{entry["InternalName"]}" class="obj_link">{val}</a>'			
-			if col_data[col_name]: # is_numeric
-				td_class += " numeric_val"
-				if val == None:
+			if is_numeric:
+				if val is None:
 					val = 0
-				if col_name in col_float_width:
-					val = f"%.{col_float_width[col_name]}f" % val
-			
-			attr_str += ' class="' + td_class + '"'
+				if float_fmt:
+					val = float_fmt % val
 			
 			if isinstance(val, list):
-				val = list(map(lambda s: re.sub(r'<(\w+)>', "[\\1]", str(s)), val))
-				val = "<br>".join(val)
+				# one sub over all items, joined by a char that can't be part of a tag
+				val = _RE_ANGLE_TAG.sub("[\\1]", "\0".join(map(str, val))).replace("\0", "<br>")
 			else:
-				val = re.sub(r'<(\w+)>', "[\\1]", str(val))
+				val = _RE_ANGLE_TAG.sub("[\\1]", str(val))
 			
-			val = render_obj_link(val)
+			val = _RE_OBJ_LINK.sub(r'<a href="#\1" class="obj_link">\2</a>', val)
 
-			if val == "True":
-				val = "&#x2713;"
-			elif val == "False":
-				val = "&#x2A09;"
+			val = bool_glyphs.get(val, val)
 
-			td_cells.append(f'<td{attr_str}>{val}</td>')
-		
-		tr_class = ""
-		if entry.get("__unavailable"):
-			tr_class = "unavailable"
-		rows.append(f'<tr id="{entry["InternalName"]}" class="{tr_class}">{"\n\t" + "\n\t".join(td_cells)}</tr>')
-	tbody_content = "\n".join(rows)
-		
-	return f'\n\n<table id="data_{name}" class="sortable {"grouped_header" if has_groups else ""}">\n<thead>{thead_content}</thead>\n<tbody>{tbody_content}</tbody>\n</table>'
+			w(f'\n\t<td{attr_str}{class_attr}>{val}</td>')
+		w('</tr>')
+	w('</tbody>\n</table>')
+
+	return buf.getvalue()
 
 def render_html(proc_data, config, game_version, ref_version, fraktur_font, gh_icon):
 	template = template_path.read_text()
 	
 	nav_html = []
-	data_html = ""
+	data_html = []
 	for k in cat_config:
 		group_cfg = config[k].get("group")
 		is_static = config[k]["fn"] == None
 
-		data_html += f"<h2 id='{k}'>{k} <a href='#top'>&#x2B71;</a></h2>"
+		data_html.append(f"<h2 id='{k}'>{k} <a href='#top'>&#x2B71;</a></h2>")
 		nav_html_item = f"<a id='nav_{k}' href='#{k}'>{k}</a>"
 				
 		if group_cfg:
@@ -1268,36 +1399,39 @@ def render_html(proc_data, config, game_version, ref_version, fraktur_font, gh_i
 			
 			subLinks = []
 			for gk in group_cfg["order"]:
-				data_html += f"<h3 id='{gk}'>{gk} <a href='#top'>&#x2B71;</a></h3>"
+				data_html.append(f"<h3 id='{gk}'>{gk} <a href='#top'>&#x2B71;</a></h3>")
 				subLinks.append(f"<a id='nav_{gk}' href='#{gk}'>{gk}</a>")
 				
 				table = render_table(groups[gk], config[k], gk, is_static)
-				data_html += table
+				data_html.append(table)
 			nav_html_item += "&#8201;&#183;&#8201;".join(subLinks)
 		else:
 			table = render_table(proc_data[k], config[k], k, is_static)
-			data_html += table
+			data_html.append(table)
 		
 		nav_html.append(nav_html_item)
 		
 	replacements = {
 		"##GAME_VERSION##": game_version,
 		"##REF_VERSION##": ref_version,
-		"##DATA##": data_html,
+		"##DATA##": "".join(data_html),
 		"##NAV##": "&#8201;|&#8201;".join(nav_html),
 		"##FRAKTUR_FONT##": fraktur_font,
 		"##GH_ICON##": gh_icon,
 	}
-	for k, v in replacements.items():
-		template = template.replace(k, v)
-	return template
+	return _RE_TEMPLATE_VAR.sub(lambda m: replacements.get(m.group(0), m.group(0)), template)
 
 ################################################################################
 ## MARK: Main run()
 ################################################################################
 
 def run():
-	exp_data.update(json.loads(data_json_path.read_text()))
+	json_loads = orjson.loads if orjson else json.loads
+	exp_data.update(json_loads(data_json_path.read_bytes()))
+	intern_object_names()
+	# objTagsMap keeps the ordered lists for display, objTagsSet is for lookups
+	exp_data["objTagsSet"] = {obj_name: frozenset(tags) for obj_name, tags in exp_data["objTagsMap"].items()}
+	gml_files.update(read_all_gml())
 
 	global_labels.update(get_global_labels())
 	global_vars.update(get_global_vars())
@@ -1306,6 +1440,8 @@ def run():
 
 	parse_object_code()
 	patch_object_code()
+	index_object_calls()
+	clear_resolve_caches()
 	proc_object_code()
 	proc_static()
 
@@ -1318,8 +1454,7 @@ def run():
 	b64_gh_icon = base64_file(Path(os.path.join(base_dir, "res", "github-icon-64.png")))
 
 	html = render_html(proc_data, cat_config, game_v, ref_v, b64_font, b64_gh_icon)
-	f = open("index.html", "w")
-	f.write(html)
-	f.close()
+	Path("index.html").write_text(html, encoding = "utf-8", newline = "\n")
 
-run()
\ No newline at end of file
+if __name__ == "__main__":
+	run()
\ No newline at end of file